@@ -1,34 +1,23 @@
-from yaml import dump
-
-try:
-    from yaml import CDumper as Dumper
-except ImportError:
-    from yaml import Dumper
+from operator import methodcaller
 
 from ..grammar import indefinites_grammar
 from ..meaning import universe as indefinites_universe
+from ..util import write_expressions
 
 
 if __name__ == "__main__":
     expressions_by_meaning = indefinites_grammar.get_unique_expressions(
         3,
-        max_size=2 ** len(indefinites_universe),
-        unique_key=lambda expr: expr.evaluate(indefinites_universe),
-        compare_func=lambda e1, e2: len(e1) < len(e2),
+        # every meaning except the trivial one
+        max_size=2 ** len(indefinites_universe) - 1,
+        # keep the shortest expression for each meaning, which is the default comparison
+        unique_key=methodcaller("evaluate", indefinites_universe),
+        prune=True,
+        # filter out the trivial meaning, results in NaNs
+        accept=lambda meaning: meaning.bits.any(),
     )
 
-    # filter out the trivial meaning, results in NaNs
-    # iterate over keys, since we need to change the dict itself
-    for meaning in list(expressions_by_meaning.keys()):
-        if len(meaning.referents) == 0:
-            del expressions_by_meaning[meaning]
-
-    with open("indefinites/outputs/generated_expressions.yml", "w") as outfile:
-        dump(
-            [
-                expressions_by_meaning[meaning].to_dict()
-                for meaning in expressions_by_meaning
-            ],
-            outfile,
-            Dumper=Dumper,
-        )
+    write_expressions(
+        expressions_by_meaning.values(),
+        "indefinites/outputs/generated_expressions.yml",
+    )
@@ -1,4 +1,5 @@
-from typing import Callable, Any
+import json
+from typing import Callable, Any, Iterable
 import pandas as pd
 
 from yaml import load, dump
@@ -74,6 +75,19 @@ def read_expressions(
     return parsed_exprs, by_meaning
 
 
+def write_expressions(
+    expressions: Iterable[GrammaticalExpression], filename: str
+) -> None:
+    """Write expressions to a YAML file that can be read by `read_expressions`.
+
+    Each expression's `to_dict()` is written on its own line as a JSON object, i.e. a YAML
+    flow mapping, so the file is valid YAML but is written much faster than with `yaml.dump`.
+    """
+    with open(filename, "w") as f:
+        for expression in expressions:
+            f.write(f"- {json.dumps(expression.to_dict())}\n")
+
+
 def write_languages(
     languages: list[Language],
     filename: str,
@@ -1,12 +1,9 @@
 """Simple Roth-Erev reinforcement learning dynamic for agents of a signaling game."""
 
 import numpy as np
-from ultk.effcomm.agent import CommunicativeAgent
-from ultk.effcomm.informativity import communicative_success
-from ultk.effcomm.information import information_rate
+from ultk.effcomm.util import build_utility_matrix, H
 from game import SignalingGame
 from tqdm import tqdm
-from typing import Any
 
 
 def simulate_learning(g: SignalingGame, num_rounds: int, learning_rate=1.0) -> None:
@@ -18,54 +15,59 @@ def simulate_learning(g: SignalingGame, num_rounds: int, learning_rate=1.0) -> N
         reward_amount: the amount to scale the utility function by, before rewarding agents with the result.
     """
 
-    for _ in tqdm(range(num_rounds)):
-        # get input to sender
-        target = np.random.choice(a=g.states, p=g.prior)
+    # The inner loop works directly with indices into the agents' weight matrices,
+    # instead of round-tripping through State and Signal objects every round.
+    utility = build_utility_matrix(g.sender.language.universe, g.utility)
+    if learning_rate < 0 or (utility < 0).any():
+        raise ValueError("Amount to reinforce weight must be a positive number.")
+    state_indices = np.array([g.sender.referent_to_index(state) for state in g.states])
+    # sample all inputs to sender up front
+    targets = state_indices[np.random.choice(len(g.states), size=num_rounds, p=g.prior)]
 
+    # Only one row of each agent's policy changes per round, so keep the normalized
+    # policies and communicative success up to date one row at a time, instead of
+    # recomputing them from scratch with `communicative_success` every round.
+    sender_policy = g.sender.normalized_weights()
+    receiver_policy = g.receiver.normalized_weights()
+    # expected utility of each signal when the sender's intended state is m: signal_utility[e, m]
+    signal_utility = receiver_policy @ utility.T
+    # communicative success of each state: success[m] = sum_e S[m, e] * signal_utility[e, m]
+    success = np.einsum("me,em->m", sender_policy, signal_utility)
+    # complexity is I[M:E] = H(E) + H(M) - H(M, E); H(M) is fixed and H(M, E) is a sum of one term per state
+    prior_entropy = H(g.prior)
+    joint_entropy = np.array(
+        [H(g.prior[m] * sender_policy[m]) for m in range(len(g.prior))]
+    )
+
+    for target in tqdm(targets):
         # record interaction
-        signal = g.sender.encode(target)
-        output = g.receiver.decode(signal)
-        amount = g.utility(target, output) * learning_rate
+        signal = g.sender.sample_strategy(index=target)
+        output = g.receiver.sample_strategy(index=signal)
+        amount = utility[target, output] * learning_rate
 
         # update agents
-        reward(
-            agent=g.sender,
-            strategy={"referent": target, "expression": signal},
-            amount=amount,
+        g.sender.weights[target, signal] += amount
+        g.receiver.weights[signal, output] += amount
+
+        # update the rows of the policies that changed
+        receiver_policy[signal] = (
+            g.receiver.weights[signal] / g.receiver.weights[signal].sum()
+        )
+        new_signal_utility = receiver_policy[signal] @ utility.T
+        success += sender_policy[:, signal] * (
+            new_signal_utility - signal_utility[signal]
         )
-        reward(
-            agent=g.receiver,
-            strategy={"referent": output, "expression": signal},
-            amount=amount,
+        signal_utility[signal] = new_signal_utility
+        sender_policy[target] = (
+            g.sender.weights[target] / g.sender.weights[target].sum()
         )
+        success[target] = sender_policy[target] @ signal_utility[:, target]
+        joint_entropy[target] = H(g.prior[target] * sender_policy[target])
 
         # track accuracy and complexity
-        g.data["accuracy"].append(
-            communicative_success(
-                speaker=g.sender, listener=g.receiver, utility=g.utility, prior=g.prior
-            )
-        )
+        g.data["accuracy"].append(float(g.prior @ success))
         g.data["complexity"].append(
-            information_rate(g.prior, g.sender.normalized_weights())
+            float(H(g.prior @ sender_policy) + prior_entropy - joint_entropy.sum())
         )
 
     return g
-
-
-def reward(agent: CommunicativeAgent, strategy: dict[str, Any], amount: float) -> None:
-    """Reward an agent for a particular referent-expression behavior.
-
-    In a signaling game, the communicative success of Sender and Receiver language protocols evolve under simple reinforcement learning dynamics. The reward function increments an agent's weight matrix at the specified location by the specified amount.
-
-    Args:
-        strategy: a dict of the form {"referent": referent, "expression": Expression}
-
-        amount: a positive number reprsenting how much to reward the behavior
-    """
-    if set(strategy.keys()) != {"referent", "expression"}:
-        raise ValueError(
-            f"The argument `strategy` must take a dict with keys 'referent' and 'expression'. Received: {strategy.keys()}'"
-        )
-    if amount < 0:
-        raise ValueError(f"Amount to reinforce weight must be a positive number.")
-    agent.weights[agent.strategy_to_indices(strategy)] += amount
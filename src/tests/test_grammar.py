@@ -1,4 +1,6 @@
-from ultk.language.grammar import Grammar, GrammaticalExpression, Rule
+import pytest
+
+from ultk.language.grammar import Grammar, GrammaticalExpression, Rule, _alias_table
 from ultk.language.semantics import Meaning, Referent, Universe
 
 
@@ -21,6 +23,12 @@ class TestGrammar:
         parsed_expression = TestGrammar.grammar.parse(TestGrammar.geq2_expr_str)
         assert str(parsed_expression) == TestGrammar.geq2_expr_str
 
+    def test_parse_custom_brackets(self):
+        parsed_expression = TestGrammar.grammar.parse(
+            " >[ n ;+[1;1] ]", opener="[", closer="]", delimiter=";"
+        )
+        assert str(parsed_expression) == TestGrammar.geq2_expr_str
+
     def test_meaning(self):
         parsed_expression = TestGrammar.grammar.parse(TestGrammar.geq2_expr_str)
         expr_meaning = parsed_expression.evaluate(TestGrammar.universe)
@@ -30,6 +38,15 @@ class TestGrammar:
         )
         assert expr_meaning == goal_meaning
 
+    def test_equality_with_direct_construction(self):
+        parsed_expression = TestGrammar.grammar.parse("+(1, 1)")
+        one = TestGrammar.grammar.parse("1")
+        direct_expression = GrammaticalExpression(
+            "+", parsed_expression.func, [one, one]
+        )
+        assert parsed_expression == direct_expression
+        assert hash(parsed_expression) == hash(direct_expression)
+
     def test_length(self):
         parsed_expression = TestGrammar.grammar.parse(TestGrammar.geq2_expr_str)
         assert len(parsed_expression) == 5
@@ -37,3 +54,43 @@ class TestGrammar:
     def test_yield(self):
         parsed_expression = TestGrammar.grammar.parse(TestGrammar.geq2_expr_str)
         assert parsed_expression.yield_string() == "n11"
+
+    def test_unique_expressions_prune(self):
+        grammar = Grammar(bool)
+        grammar.add_rule(Rule("and", bool, (bool, bool), lambda x, y: x and y))
+        grammar.add_rule(Rule("or", bool, (bool, bool), lambda x, y: x or y))
+        grammar.add_rule(Rule("not", bool, (bool,), lambda x: not x))
+        for num in range(4):
+            grammar.add_rule(
+                Rule(f"{num}", bool, (), lambda model, num=num: model.num == num)
+            )
+        kwargs = {
+            "unique_key": lambda expr: expr.evaluate(TestGrammar.universe),
+            "compare_func": lambda e1, e2: len(e1) < len(e2),
+        }
+        unpruned = grammar.get_unique_expressions(3, **kwargs)
+        pruned = grammar.get_unique_expressions(3, prune=True, **kwargs)
+        # the default comparison is also by length
+        assert (
+            grammar.get_unique_expressions(3, unique_key=kwargs["unique_key"])
+            == unpruned
+        )
+        assert {key: len(expr) for key, expr in pruned.items()} == {
+            key: len(expr) for key, expr in unpruned.items()
+        }
+        # keys rejected by `accept` are left out, without changing the rest
+        accepted = grammar.get_unique_expressions(
+            3, prune=True, accept=lambda meaning: bool(meaning.referents), **kwargs
+        )
+        assert {key: len(expr) for key, expr in accepted.items()} == {
+            key: len(expr) for key, expr in unpruned.items() if key.referents
+        }
+
+    def test_alias_table(self):
+        weights = [1.0, 2.0, 3.0, 0.0, 4.0]
+        prob, alias = _alias_table(weights)
+        sampled = [0.0] * len(weights)
+        for idx in range(len(weights)):
+            sampled[idx] += prob[idx] / len(weights)
+            sampled[alias[idx]] += (1 - prob[idx]) / len(weights)
+        assert sampled == pytest.approx([weight / sum(weights) for weight in weights])
@@ -1,7 +1,7 @@
 import itertools
 import pandas as pd
 
-from ultk.language.semantics import Universe
+from ultk.language.semantics import Referent, Universe
 
 
 forces = ("weak", "strong")
@@ -16,3 +16,17 @@ def test_universe_from_df():
     dataframe = pd.DataFrame(points)
     universe = Universe.from_dataframe(dataframe)
     assert points == [referent.__dict__ for referent in universe.referents]
+
+
+def test_universe_properties():
+    points = [
+        {"name": f"{force}+{flavor}", "force": force, "flavor": flavor}
+        for (force, flavor) in itertools.product(forces, flavors)
+    ]
+    from_df = Universe.from_dataframe(pd.DataFrame(points)).properties
+    from_referents = Universe(
+        [Referent(point["name"], point) for point in points]
+    ).properties
+    for properties in (from_df, from_referents):
+        assert list(properties["force"]) == [point["force"] for point in points]
+        assert list(properties["flavor"] == "deontic") == [False, True, False, True]
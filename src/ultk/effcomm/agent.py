@@ -112,9 +112,17 @@ class CommunicativeAgent:
         Returns:
             the integer index of the agent's choice
         """
-        choices = self.weights[index]
-        choices_normalized = choices / choices.sum()
-        return np.random.choice(a=range(len(choices)), p=choices_normalized)
+        # inverse transform sampling on the unnormalized weights
+        cumulative_weights = np.cumsum(self.weights[index])
+        if not cumulative_weights[-1] > 0:
+            raise ValueError(
+                f"Cannot sample from row {index} of the weight matrix, whose weights must have a positive sum."
+            )
+        return int(
+            cumulative_weights.searchsorted(
+                np.random.random() * cumulative_weights[-1], side="right"
+            )
+        )
 
     def to_language(
         self,
@@ -1,9 +1,12 @@
 import random
 import re
+import weakref
 from collections import defaultdict
+from functools import lru_cache
 from itertools import product
 from typing import Any, Callable, Generator, Iterable
 
+import numpy as np
 from yaml import load
 
 try:
@@ -15,6 +18,75 @@ from ultk.language.language import Expression
 from ultk.language.semantics import Meaning, Universe
 
 
+def _child_depths(
+    depth: int, num_children: int
+) -> Generator[tuple[int, ...], None, None]:
+    """Generate the tuples of child depths for an expression at `depth`, i.e. all tuples in
+    `range(depth) ** num_children` with at least one child at `depth - 1`.
+
+    Tuples are generated in the same (lexicographic) order as `product(range(depth), repeat=num_children)`,
+    but without producing and filtering out the ones whose children are all too shallow.
+    """
+    if num_children == 0:
+        return
+    for first_depth in range(depth):
+        if first_depth == depth - 1:
+            rest_depths = product(range(depth), repeat=num_children - 1)
+        else:
+            rest_depths = _child_depths(depth, num_children - 1)
+        for rest in rest_depths:
+            yield (first_depth,) + rest
+
+
+def _alias_table(weights: list[float]) -> tuple[list[float], list[int]]:
+    """Build a table for sampling index i with probability proportional to `weights[i]` in constant
+    time, with Walker's alias method: draw i uniformly, then keep it with probability `prob[i]`,
+    or else take `alias[i]`.
+
+    Returns:
+        the lists `prob` and `alias`
+    """
+    num = len(weights)
+    total = sum(weights)
+    scaled = [weight * num / total for weight in weights]
+    prob = [1.0] * num
+    alias = list(range(num))
+    small = [idx for idx, weight in enumerate(scaled) if weight < 1]
+    large = [idx for idx, weight in enumerate(scaled) if weight >= 1]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        # the rest of the probability mass of `less`'s column goes to `more`
+        prob[less] = scaled[less]
+        alias[less] = more
+        scaled[more] -= 1 - scaled[less]
+        (small if scaled[more] < 1 else large).append(more)
+    # whatever is left over is 1 up to rounding errors, so keeps prob 1
+    return prob, alias
+
+
+@lru_cache(maxsize=None)
+def _parse_regex(opener: str, closer: str, delimiter: str) -> re.Pattern:
+    """Compile the regex used by `Grammar.parse` to tokenize strings, roughly by splitting at open brackets,
+    close brackets, and delimiters.
+
+    Each match (including surrounding whitespace) has exactly one named group set:
+        `opener`: the name of a rule, followed by `opener`
+        `closer`: `delimiter` or `closer`, either of which finishes a child expression
+        `primitive`: the name of a rule with no children
+    """
+    open_re, close_re, delimit_re = (
+        re.escape(opener),
+        re.escape(closer),
+        re.escape(delimiter),
+    )
+    # names can't contain the special characters, or start or end with whitespace
+    name_char = f"[^{open_re}{close_re}{delimit_re}\\s]"
+    name_pattern = f"{name_char}(?:[^{open_re}{close_re}{delimit_re}]*{name_char})?"
+    return re.compile(
+        rf"\s*(?:(?P<opener>{name_pattern})\s*{open_re}|(?P<closer>{delimit_re}|{close_re})|(?P<primitive>{name_pattern}))\s*"
+    )
+
+
 class Rule:
     """Basic class for a grammar rule.  Grammar rules in ULTK correspond
     to functions.  One can think of a grammar as generating complex functions from
@@ -29,6 +101,11 @@ class Rule:
         name: name of the function
         weight: a relative weight to assign to this rule
             when added to a grammar, all rules with the same LHS will be weighted together
+        vec_func: a vectorized version of `func`, used when evaluating expressions over a whole Universe at once
+            for a rule with children, it takes one array per child (with one entry per referent) and returns such an array;
+            defaults to `np.vectorize(func)`
+            for a rule without children (i.e. terminal or with an empty `rhs`), it takes a Universe and returns an array
+            with the value of `func` at each referent; defaults to calling `func` on each referent
     """
 
     def __init__(
@@ -38,12 +115,16 @@ class Rule:
         rhs: Iterable[Any],
         func: Callable = lambda *args: None,
         weight: float = 1.0,
+        vec_func: Callable = None,
     ):
         self.lhs = lhs
         self.rhs = rhs
         self.func = func
         self.name = name
         self.weight = weight
+        if vec_func is None and self.rhs:
+            vec_func = np.vectorize(func, otypes=[object])
+        self.vec_func = vec_func
 
     def is_terminal(self) -> bool:
         """Whether this is a terminal rule.  In our framework, this means that RHS is empty,
@@ -69,6 +150,7 @@ class GrammaticalExpression(Expression):
         name: name of the top-most function
         func: the function
         children: child expressions (possibly empty)
+        vec_func: vectorized version of the function, see `Rule`
     """
 
     def __init__(
@@ -78,11 +160,22 @@ class GrammaticalExpression(Expression):
         children: Iterable,
         meaning: Meaning = None,
         form: str = None,
+        vec_func: Callable = None,
     ):
         super().__init__(form, meaning)
         self.rule_name = rule_name
         self.func = func
         self.children = children
+        self.vec_func = vec_func
+        # (universe, extension) of the most recent call to `_extension`
+        self._cached_extension = None
+        # NB: children are not modified after construction, so length, hash and strings only need computing once
+        self._children_tuple = tuple(children) if children is not None else ()
+        self._len = 1 + sum(len(child) for child in self._children_tuple)
+        self._hash = hash((rule_name, self.form, func, self._children_tuple))
+        # computed on first use, since most enumerated expressions are never printed
+        self._str = None
+        self._yield = None
 
     def yield_string(self) -> str:
         """Get the 'yield' string of this term, i.e. the concatenation
@@ -92,22 +185,48 @@ class GrammaticalExpression(Expression):
         an underlying CFG.  This method will then generate the strings generated by
         the corresponding CFG.
         """
-        if self.children is None:
-            return str(self)
-        return "".join(child.yield_string() for child in self.children)
+        if self._yield is None:
+            if self.children is None:
+                self._yield = str(self)
+            else:
+                self._yield = "".join(child.yield_string() for child in self.children)
+        return self._yield
 
     def evaluate(self, universe: Universe) -> Meaning:
         # TODO: this presupposes that the expression has type Referent -> bool.  Should we generalize?
         # and that leaf nodes will take Referents as input...
         # NB: important to use `not self.meaning` and not `self.meaning is None` because of how
         # Expression.__init__ initializes an "empty" meaning if `None` is passed
-        if not self.meaning:
-            self.meaning = Meaning(
-                [referent for referent in universe.referents if self(referent)],
-                universe,
+        if not self.meaning or self.meaning.universe is not universe:
+            self.meaning = Meaning.from_mask(
+                np.asarray(self._extension(universe), dtype=bool), universe
             )
         return self.meaning
 
+    def _extension(self, universe: Universe) -> np.ndarray:
+        """Get the value of this expression at every referent of a universe, as an array.
+
+        A node's extension is computed by a single call of `vec_func` on the extensions of its
+        children, instead of calling `func` for every referent over the whole subtree.
+        Results are memoized on each node; since a Grammar interns its expressions, subtrees shared
+        by many expressions (e.g. the children built during enumeration) are only computed once.
+        """
+        if self._cached_extension is not None and self._cached_extension[0] is universe:
+            return self._cached_extension[1]
+        if not self.children:
+            if self.vec_func is not None:
+                extension = self.vec_func(universe)
+            else:
+                extension = np.array(
+                    [self(referent) for referent in universe.referents]
+                )
+        else:
+            child_extensions = [child._extension(universe) for child in self.children]
+            vec_func = self.vec_func or np.vectorize(self.func, otypes=[object])
+            extension = vec_func(*child_extensions)
+        self._cached_extension = (universe, extension)
+        return extension
+
     def to_dict(self) -> dict:
         the_dict = super().to_dict()
         the_dict["grammatical_expression"] = str(self)
@@ -120,39 +239,61 @@ class GrammaticalExpression(Expression):
         return self.func(*(child(*args) for child in self.children))
 
     def __len__(self):
-        length = 1
-        if self.children is not None:
-            length += sum(len(child) for child in self.children)
-        return length
+        return self._len
 
     def __eq__(self, other) -> bool:
-        return (self.rule_name, self.form, self.func, self.children) == (
+        # expressions built by a Grammar are interned, so equal ones are usually the same object
+        if self is other:
+            return True
+        if self._hash != other._hash:
+            return False
+        return (self.rule_name, self.form, self.func, self._children_tuple) == (
             other.rule_name,
             other.form,
             other.func,
-            other.children,
+            other._children_tuple,
         )
 
     def __hash__(self) -> int:
-        # when self.children is None...
-        children = self.children or tuple([])
-        return hash((self.rule_name, self.form, self.func, tuple(children)))
+        return self._hash
 
     def __lt__(self, other) -> bool:
-        children = self.children or tuple([])
-        other_children = other.children or tuple([])
-        return (self.rule_name, self.form, self.func, children) < (
+        return (self.rule_name, self.form, self.func, self._children_tuple) < (
             other.rule_name,
             other.form,
             other.func,
-            other_children,
+            other._children_tuple,
         )
 
     def __str__(self):
-        out_str = self.rule_name
-        if self.children is not None:
-            out_str += f"({', '.join(str(child) for child in self.children)})"
-        return out_str
+        if self._str is None:
+            self._str = self.rule_name
+            if self.children is not None:
+                self._str += f"({', '.join(str(child) for child in self.children)})"
+        return self._str
+
+
+def _add_unique(
+    unique_dict: dict[Any, GrammaticalExpression],
+    key: Any,
+    expression: GrammaticalExpression,
+    compare_func: Callable[[GrammaticalExpression, GrammaticalExpression], bool],
+) -> bool:
+    """Store `expression` under `key` in `unique_dict` if the key is new, or if the expression is "less than"
+    the current entry according to `compare_func` (by default, if it is shorter).
+
+    Returns:
+        whether `expression` was stored
+    """
+    if key in unique_dict:
+        if compare_func is None:
+            # compare the lengths directly, without a function call per comparison
+            if expression._len >= unique_dict[key]._len:
+                return False
+        elif not compare_func(expression, unique_dict[key]):
+            return False
+    unique_dict[key] = expression
+    return True
 
 
 class Grammar:
@@ -164,15 +305,49 @@ class Grammar:
         # name -> rule, for fast lookup in parsing
         self._rules_by_name = {}
         self._start = start
+        # (depth, lhs) -> all expressions at that depth, materialized once for re-use as children
+        self._depth_cache: dict[tuple[int, Any], list[GrammaticalExpression]] = {}
+        # (rule name, ids of children) -> the one live expression with that structure, see `_make`
+        self._intern: weakref.WeakValueDictionary[tuple, GrammaticalExpression] = (
+            weakref.WeakValueDictionary()
+        )
+        # lhs -> (rules, alias table of their weights), for sampling in `generate`
+        self._alias: dict[Any, tuple[list[Rule], list[float], list[int]]] = {}
 
     def add_rule(self, rule: Rule):
         self._rules[rule.lhs].append(rule)
+        # cached enumerations and weights are no longer complete
+        self._depth_cache.clear()
+        self._alias.clear()
         if rule.name in self._rules_by_name:
             raise ValueError(
                 f"Rules of a grammar must have unique names. This grammar already has a rule named {rule.name}."
             )
         self._rules_by_name[rule.name] = rule
 
+    def _make(
+        self, rule: Rule, children: Iterable[GrammaticalExpression] = None
+    ) -> GrammaticalExpression:
+        """Build the GrammaticalExpression applying `rule` to `children`, re-using an existing one if possible.
+
+        Expressions are interned: as long as an expression built by this Grammar is alive, building one
+        with the same rule and children returns that same object.  Since children are themselves interned,
+        structurally equal subtrees are shared, and comparing them reduces to an identity check.
+        """
+        if children is not None:
+            children = tuple(children)
+            key = (rule.name, tuple(id(child) for child in children))
+        else:
+            key = (rule.name, None)
+        expression = self._intern.get(key)
+        if expression is None:
+            expression = GrammaticalExpression(
+                rule.name, rule.func, children, vec_func=rule.vec_func
+            )
+            # NB: keys stay valid, since an expression keeps its children (and so their ids) alive
+            self._intern[key] = expression
+        return expression
+
     def parse(
         self,
         expression: str,
@@ -193,59 +368,50 @@ class Grammar:
             the corresponding GrammaticalExpression
         """
         # see nltk.tree.Tree.fromstring for inspiration
-        # tokenize string roughly by splitting at open brackets, close brackets, and delimiters
-        open_re, close_re, delimit_re = (
-            re.escape(opener),
-            re.escape(closer),
-            re.escape(delimiter),
-        )
-        name_pattern = f"[^{open_re}{close_re}{delimit_re}]+"
-        token_regex = re.compile(
-            rf"{name_pattern}{open_re}|{name_pattern}|{delimit_re}\s*|{close_re}"
-        )
+        token_regex = _parse_regex(opener, closer, delimiter)
+        rules = self._rules_by_name
 
         # stack to store the tree being built
         stack = []
+        stack_append, stack_pop = stack.append, stack.pop
 
+        # items are (rule, children) pairs; expressions are built once all their children are known
         for match in token_regex.finditer(expression):
-            # strip trailing whitespace if needed
-            token = match.group().strip()
+            token_type = match.lastgroup
             # start a new expression
-            if token[-1] == opener:
-                name = token[:-1]
-                stack.append(
-                    GrammaticalExpression(name, self._rules_by_name[name].func, [])
-                )
+            if token_type == "opener":
+                stack_append((rules[match.group("opener")], []))
             # finish an expression
-            elif token == delimiter or token == closer:
+            elif token_type == "closer":
                 # finished a child expression
                 # TODO: are there edge cases that distinguish delimiter from closer?
-                child = stack.pop()
-                stack[-1].children.append(child)
+                child = self._make(*stack_pop())
+                stack[-1][1].append(child)
             else:
                 # primitive, no children, just look up
-                stack.append(
-                    GrammaticalExpression(token, self._rules_by_name[token].func, None)
-                )
+                stack_append((rules[match.group("primitive")], None))
         if len(stack) != 1:
-            raise ValueError("Could not parse string {expression}")
-        return stack[0]
+            raise ValueError(f"Could not parse string {expression}")
+        return self._make(*stack[0])
 
     def generate(self, lhs: Any = None) -> GrammaticalExpression:
         """Generate an expression from a given lhs."""
         if lhs is None:
             lhs = self._start
-        rules = self._rules[lhs]
-        the_rule = random.choices(rules, weights=[rule.weight for rule in rules], k=1)[
-            0
-        ]
+        if lhs not in self._alias:
+            rules = self._rules[lhs]
+            self._alias[lhs] = (rules, *_alias_table([rule.weight for rule in rules]))
+        rules, prob, alias = self._alias[lhs]
+        # pick a rule with probability proportional to its weight, in constant time
+        idx = random.randrange(len(rules))
+        the_rule = rules[idx] if random.random() < prob[idx] else rules[alias[idx]]
         children = (
             None
             if the_rule.rhs is None
             else [self.generate(child_lhs) for child_lhs in the_rule.rhs]
         )
         # if the rule is terminal, rhs will be empty, so no recursive calls to generate will be made in this comprehension
-        return GrammaticalExpression(the_rule.name, the_rule.func, children)
+        return self._make(the_rule, children)
 
     def enumerate(
         self,
@@ -256,6 +422,8 @@ class Grammar:
         compare_func: Callable[
             [GrammaticalExpression, GrammaticalExpression], bool
         ] = None,
+        prune: bool = False,
+        accept: Callable[[Any], bool] = None,
     ) -> Generator[GrammaticalExpression, None, None]:
         """Enumerate all expressions from the grammar up to a given depth from a given LHS.
         This method also can update a specified dictionary to store only unique expressions, with
@@ -268,15 +436,33 @@ class Grammar:
             unique_key: a function used to evaluate uniqueness
             compare_func: a comparison function, used to decide which Expression to add to the dict
                 new Expressions will be added as values to `unique_dict` only if they are minimal
-                among those sharing the same key (by `unique_key`) according to this func
+                among those sharing the same key (by `unique_key`) according to this func;
+                defaults to keeping the shortest Expression (i.e. `len(e1) < len(e2)`), which is faster
+                than passing that function explicitly
+            prune: if True (and `unique_dict` and `unique_key` are given), only build expressions whose
+                children of type `lhs` are the best expressions so far for their keys (including keys
+                rejected by `accept`, which are tracked separately from `unique_dict`), skipping
+                every expression that has a child which already lost to another one with the same key.
+                Each depth is then built only from the best expressions found at lower depths.
+                This is only safe when the key of an expression is determined by its rule and the keys
+                of its children (e.g. its meaning), and when replacing a child by one that is preferred
+                by `compare_func` also gives a preferred parent (e.g. for length).  Ties under
+                `compare_func` may then be resolved differently than without pruning.
+            accept: a predicate on keys; expressions whose key it rejects are never added to `unique_dict`
+                (but are still yielded), e.g. to leave out expressions with a trivial meaning
 
         Yields:
-            all GrammaticalExpressions up to depth
+            all GrammaticalExpressions up to depth; with `prune`, only those built from children that
+            were not pruned
         """
-        # TODO: update docstring!
         # TODO: package uniqueness stuff in one dict arg?
         if lhs is None:
             lhs = self._start
+        if prune and unique_dict is not None and unique_key is not None:
+            yield from self._enumerate_pruned(
+                depth, lhs, unique_dict, unique_key, compare_func, accept
+            )
+            return
         for num in range(depth):
             for expr in self.enumerate_at_depth(
                 num,
@@ -284,6 +470,7 @@ class Grammar:
                 unique_dict=unique_dict,
                 unique_key=unique_key,
                 compare_func=compare_func,
+                accept=accept,
             ):
                 yield expr
 
@@ -296,27 +483,92 @@ class Grammar:
         compare_func: Callable[
             [GrammaticalExpression, GrammaticalExpression], bool
         ] = None,
+        accept: Callable[[Any], bool] = None,
     ) -> set[GrammaticalExpression]:
-        """Enumerate GrammaticalExpressions for this Grammar _at_ a fixed depth."""
-
-        do_unique = unique_key is not None and compare_func is not None
+        """Enumerate GrammaticalExpressions for this Grammar _at_ a fixed depth.
+        See `enumerate` for the arguments (other than `prune`, which needs all lower depths).
+        """
 
-        def add_unique(expression: GrammaticalExpression) -> None:
-            expr_key = unique_key(expression)
-            # if the current expression has not been generated yet
-            # OR it is "less than" the current entry, add this one
-            if expr_key not in unique_dict or compare_func(
-                expression, unique_dict[expr_key]
+        do_unique = unique_dict is not None and unique_key is not None
+
+        # stream the expressions unless they've already been materialized (e.g. as children of deeper ones)
+        if (depth, lhs) in self._depth_cache:
+            expressions = self._depth_cache[(depth, lhs)]
+        else:
+            expressions = self._generate_at_depth(depth, lhs)
+        for cur_expr in expressions:
+            if do_unique:
+                expr_key = unique_key(cur_expr)
+                if accept is None or accept(expr_key):
+                    _add_unique(unique_dict, expr_key, cur_expr, compare_func)
+            yield cur_expr
+
+    def _enumerate_pruned(
+        self,
+        depth: int,
+        lhs: Any,
+        unique_dict: dict[Any, GrammaticalExpression],
+        unique_key: Callable[[GrammaticalExpression], Any],
+        compare_func: Callable[[GrammaticalExpression, GrammaticalExpression], bool],
+        accept: Callable[[Any], bool],
+    ) -> Generator[GrammaticalExpression, None, None]:
+        """`enumerate` with `prune`: each depth is built only from the children (of type `lhs`) at lower
+        depths that are the best so far for their keys."""
+        # key -> best expression so far, like `unique_dict` but also for keys rejected by `accept`,
+        # since expressions with those keys are just as much worth pruning
+        best: dict[Any, GrammaticalExpression] = {}
+        # depth -> (key, expression) for the expressions that were the best for their key when enumerated
+        candidates: dict[int, list[tuple[Any, GrammaticalExpression]]] = {}
+        for cur_depth in range(depth):
+            # drop the candidates that have lost to a better expression since; this is done before this depth
+            # starts updating `best`, so that a pruned child is always replaced by one at a lower depth
+            representatives = {}
+            for child_depth, pairs in candidates.items():
+                candidates[child_depth] = [
+                    (key, expr) for key, expr in pairs if best[key] is expr
+                ]
+                representatives[child_depth] = [
+                    expr for _, expr in candidates[child_depth]
+                ]
+
+            def children_at_depth(child_depth: int, child_lhs: Any):
+                if child_lhs != lhs:
+                    return self._expressions_at_depth(child_depth, child_lhs)
+                return representatives[child_depth]
+
+            candidates[cur_depth] = []
+            for expression in self._generate_at_depth(
+                cur_depth, lhs, children_at_depth
             ):
-                unique_dict[expr_key] = expression
-
+                key = unique_key(expression)
+                if _add_unique(best, key, expression, compare_func):
+                    candidates[cur_depth].append((key, expression))
+                    if accept is None or accept(key):
+                        _add_unique(unique_dict, key, expression, compare_func)
+                yield expression
+
+    def _expressions_at_depth(
+        self, depth: int, lhs: Any
+    ) -> list[GrammaticalExpression]:
+        """Get all GrammaticalExpressions at a fixed depth, enumerating them only the first time."""
+        if (depth, lhs) not in self._depth_cache:
+            self._depth_cache[(depth, lhs)] = list(self._generate_at_depth(depth, lhs))
+        return self._depth_cache[(depth, lhs)]
+
+    def _generate_at_depth(
+        self,
+        depth: int,
+        lhs: Any,
+        children_at_depth: Callable[[int, Any], list[GrammaticalExpression]] = None,
+    ) -> Generator[GrammaticalExpression, None, None]:
+        """Generate the GrammaticalExpressions at a fixed depth.  The possible children at each depth
+        come from `children_at_depth(depth, lhs)`, which defaults to the cache."""
+        if children_at_depth is None:
+            children_at_depth = self._expressions_at_depth
         if depth == 0:
             for rule in self._rules[lhs]:
                 if rule.is_terminal():
-                    cur_expr = GrammaticalExpression(rule.name, rule.func, None)
-                    if do_unique:
-                        add_unique(cur_expr)
-                    yield cur_expr
+                    yield self._make(rule)
 
         for rule in self._rules[lhs]:
             # can't use terminal rules when depth > 0
@@ -324,21 +576,16 @@ class Grammar:
                 continue
 
             # get lists of possible depths for each child
-            for child_depths in product(range(depth), repeat=len(rule.rhs)):
-                if max(child_depths) < depth - 1:
-                    continue
+            for child_depths in _child_depths(depth, len(rule.rhs)):
                 # get all possible children of the relevant depths
                 children_iter = product(
                     *[
-                        self.enumerate_at_depth(child_depth, child_lhs)
+                        children_at_depth(child_depth, child_lhs)
                         for child_depth, child_lhs in zip(child_depths, rule.rhs)
                     ]
                 )
                 for children in children_iter:
-                    cur_expr = GrammaticalExpression(rule.name, rule.func, children)
-                    if do_unique:
-                        add_unique(cur_expr)
-                    yield cur_expr
+                    yield self._make(rule, children)
 
     def get_unique_expressions(
         self,
@@ -349,12 +596,14 @@ class Grammar:
         compare_func: Callable[
             [GrammaticalExpression, GrammaticalExpression], bool
         ] = None,
+        prune: bool = False,
+        accept: Callable[[Any], bool] = None,
     ) -> dict[GrammaticalExpression, Any]:
         """Get all unique GrammaticalExpressions, up to a certain depth, with a user-specified criterion
         of uniqueness, and a specified comparison function for determining which Expression to save when there's a clash.
         This can be used, for instance, to measure the minimum description length of some
         Meanings, by using expression.evaluate(), which produces a Meaning for an Expression, as the
-        key for determining uniqueness, and length of the expression as comparison.
+        key for determining uniqueness, and length of the expression as comparison (the default).
 
         This is a wrapper around `enumerate`, but which produces the dictionary of key->Expression entries
         and returns it.  (`enumerate` is a generator with side effects).
@@ -377,6 +626,8 @@ class Grammar:
             unique_dict=unique_dict,
             unique_key=unique_key,
             compare_func=compare_func,
+            prune=prune,
+            accept=accept,
         ):
             if len(unique_dict) == max_size:
                 break
@@ -408,6 +659,7 @@ class Grammar:
           - bool
           name: "and"
           function: "lambda p1, p2 : p1 and p2"
+          vec_function: "lambda p1, p2 : np.logical_and(p1, p2)"
         - lhs: bool
           rhs:
           - bool
@@ -416,8 +668,8 @@ class Grammar:
           function: "lambda p1, p2 : p1 or p2"
         ```
 
-        Note that for each fule, the value for `function` will be passed to
-        `eval`, so be careful!
+        Note that for each fule, the value for `function` (and the optional
+        `vec_function`, see `Rule.vec_func`) will be passed to `eval`, so be careful!
 
         Arguments:
             filename: file containing a grammar in the above format
@@ -433,6 +685,11 @@ class Grammar:
                     rule_dict["rhs"],
                     # TODO: look-up functions from a registry as well?
                     eval(rule_dict["function"]),
+                    vec_func=(
+                        eval(rule_dict["vec_function"])
+                        if "vec_function" in rule_dict
+                        else None
+                    ),
                 )
             )
         return grammar
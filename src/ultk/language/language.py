@@ -17,6 +17,9 @@ from ultk.language.semantics import Universe
 from ultk.language.semantics import Meaning, Referent
 from typing import Callable, Iterable
 
+# shared placeholder for Expressions built without a Meaning
+_empty_meaning = Meaning(tuple([]), Universe(tuple([])))
+
 
 class Expression:
 
@@ -27,7 +30,7 @@ class Expression:
         # useful for hashing in certain cases
         # (e.g. a GrammaticalExpression which has not yet been evaluate()'d and so does not yet have a Meaning)
         self.form = form or ""
-        self.meaning = meaning or Meaning(tuple([]), Universe(tuple([])))
+        self.meaning = meaning or _empty_meaning
 
     def can_express(self, referent: Referent) -> bool:
         """Return True if the expression can express the input single meaning point and false otherwise."""
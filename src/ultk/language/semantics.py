@@ -17,11 +17,21 @@
         >>> a_few = NumeralExpression(form="a few", meaning=a_few_meaning)
 """
 
+from functools import cached_property
+from itertools import compress
 from typing import Iterable, Union
 import numpy as np
 import pandas as pd
 
 
+def _pack_bits(mask: np.ndarray, n_words: int) -> np.ndarray:
+    """Pack a boolean vector into a bitset of `n_words` little-endian uint64 words (bit i is entry i of `mask`)."""
+    packed = np.zeros(8 * n_words, dtype=np.uint8)
+    packed_mask = np.packbits(mask, bitorder="little")
+    packed[: len(packed_mask)] = packed_mask
+    return packed.view("<u8")
+
+
 class Referent:
     """A referent is some object in the universe for a language."""
 
@@ -49,8 +59,17 @@ class Universe:
     """The universe is the set of possible referent objects for a meaning."""
 
     def __init__(self, referents: Iterable[Referent], prior: dict[str, float] = None):
+        # a Universe is not changed after it is built, so its referents are fixed as a tuple
+        referents = tuple(referents)
         self.referents = referents
         self._referents_by_name = {referent.name: referent for referent in referents}
+        # referent -> position in `referents`, e.g. for indexing boolean masks
+        self._referent_index = {referent: idx for idx, referent in enumerate(referents)}
+        # for fast membership checks and comparisons that don't rely on Referent.__hash__
+        self._referent_id_set = frozenset(id(referent) for referent in referents)
+        self._hash = hash(self._referent_id_set)
+        # meanings are stored as bitsets over `referents`, packed into uint64 words
+        self.n_words = (len(referents) + 63) // 64
         # set to uniform prior if none specified
         size = len(referents)
         prior = prior or {referent.name: 1 / size for referent in referents}
@@ -58,9 +77,31 @@ class Universe:
 
     def set_prior(self, prior: dict[str, float]):
         self._prior = prior
+        self._prior_numpy = np.array(
+            [self._prior[referent.name] for referent in self.referents]
+        )
+        # shared by every caller of `prior_numpy`, so it must not be changed in place
+        self._prior_numpy.setflags(write=False)
 
     def prior_numpy(self) -> np.ndarray:
-        return np.array([self._prior[referent.name] for referent in self.referents])
+        return self._prior_numpy
+
+    @cached_property
+    def properties(self) -> dict[str, np.ndarray]:
+        """The properties of the referents, stored by column: a dict from each property name
+        to an array of that property's value for each referent, in the order of `referents`.
+
+        Only properties that every referent has are included.  This is convenient for computing
+        the value of a predicate on all referents at once, e.g. `universe.properties["name"] == "a"`.
+        """
+        if not self.referents:
+            return {}
+        shared = set.intersection(*(set(vars(referent)) for referent in self.referents))
+        return {
+            prop: np.array([getattr(referent, prop) for referent in self.referents])
+            for prop in vars(self.referents[0])
+            if prop in shared
+        }
 
     def __getitem__(self, key: Union[str, int]) -> Referent:
         if type(key) is str:
@@ -75,15 +116,15 @@ class Universe:
         return f"Points:\n\t{referents_str}\nDistribution:\n\t{self._prior}"
 
     def __eq__(self, __o: object) -> bool:
-        """Returns true if the two universes are the same set."""
+        """Returns true if the two universes are the same set of referents."""
         # TODO: may want to generalize to checking additional structure.  Or just leave that to sub-classes?
-        return set(self.referents) == set(__o.referents)
+        return self._referent_id_set == __o._referent_id_set
 
     def __len__(self) -> int:
         return len(self.referents)
 
     def __hash__(self) -> int:
-        return hash(self.referents)
+        return self._hash
 
     @classmethod
     def from_dataframe(cls, df: pd.DataFrame):
@@ -99,7 +140,10 @@ class Universe:
             prior = dict(zip(df["name"], df["probability"]))
         records = df.to_dict("records")
         referents = tuple(Referent(record["name"], record) for record in records)
-        return cls(referents, prior)
+        universe = cls(referents, prior)
+        # the columns already are the properties
+        universe.properties = {column: df[column].to_numpy() for column in df.columns}
+        return universe
 
     @classmethod
     def from_csv(cls, filename: str):
@@ -135,7 +179,9 @@ class Meaning:
 
             dist: a dict of with Referent names as keys and weights or probabilities as values, representing the distribution over referents to associate with the meaning. By default is None, and the distribution will be uniform over the passed referents, and any remaining referents are assigned 0 probability.
         """
-        if not set(referents).issubset(set(universe.referents)):
+        # cheap check on identities first; only fall back to Referent equality if that fails
+        in_universe = {id(ref) for ref in referents} <= universe._referent_id_set
+        if not (in_universe or set(referents).issubset(universe.referents)):
             print("referents:")
             print([str(r) for r in referents])
             print("universe:")
@@ -143,24 +189,95 @@ class Meaning:
             raise ValueError(
                 f"The set of referents for a meaning must be a subset of the universe of discourse."
             )
+        self._init_trusted(referents, universe, dist)
 
+    def _init_trusted(
+        self,
+        referents: Iterable[Referent],
+        universe: Universe,
+        dist: dict[str, float] = None,
+        mask: np.ndarray = None,
+    ) -> None:
+        """Initialize without checking that `referents` is a subset of `universe`, see `_from_referents_trusted`."""
         self.referents = referents
         self.universe = universe
-
-        zeros = {
-            ref.name: 0.0 for ref in set(self.universe.referents) - set(self.referents)
-        }
-        if dist is not None:
+        # boolean vector over `universe.referents`, True for the referents in this meaning
+        if mask is None:
+            mask = np.zeros(len(universe), dtype=bool)
+            mask[[universe._referent_index[referent] for referent in referents]] = True
+        self.mask = mask
+        # weights for `dist`, which is only built if needed
+        self._weights = dist
+
+    @cached_property
+    def bits(self) -> np.ndarray:
+        """The same set as `mask`, as a bitset, for cheap hashing and comparison."""
+        return _pack_bits(self.mask, self.universe.n_words)
+
+    @cached_property
+    def _key(self) -> bytes:
+        """The bytes of `bits`, computed once for hashing and comparison."""
+        return self.bits.tobytes()
+
+    @cached_property
+    def _dist_arr(self) -> np.ndarray:
+        """The distribution associated with this meaning, as an array over `universe.referents`."""
+        dist_arr = np.zeros(len(self.universe))
+        if not self.referents:
+            return dist_arr
+        if self._weights is not None:
             # normalize weights to distribution
-            total_weight = sum(dist.values())
-            self.dist = {
-                ref.name: dist[ref.name] / total_weight for ref in self.referents
-            } | zeros
-
+            total_weight = sum(self._weights.values())
+            dist_arr[self.mask] = [
+                self._weights[ref.name]
+                for ref in compress(self.universe.referents, self.mask)
+            ]
+            dist_arr /= total_weight
         else:
-            self.dist = {
-                ref.name: 1 / len(self.referents) for ref in self.referents
-            } | zeros
+            dist_arr[self.mask] = 1 / len(self.referents)
+        return dist_arr
+
+    @cached_property
+    def dist(self) -> dict[str, float]:
+        """The distribution over the universe's referents associated with this meaning, as a dict from
+        Referent names to probabilities."""
+        return {
+            ref.name: prob
+            for ref, prob in zip(self.universe.referents, self._dist_arr.tolist())
+        }
+
+    @classmethod
+    def from_mask(cls, mask: np.ndarray, universe: Universe):
+        """Build a Meaning from a boolean vector over the referents of a Universe.
+
+        Args:
+            mask: array of shape `(len(universe),)`, True at the index of each referent in the meaning
+
+            universe: the Universe that `mask` is defined over
+        """
+        return cls._from_referents_trusted(
+            [universe.referents[idx] for idx in np.flatnonzero(mask)],
+            universe,
+            mask=mask,
+        )
+
+    @classmethod
+    def _from_referents_trusted(
+        cls,
+        referents: Iterable[Referent],
+        universe: Universe,
+        dist: dict[str, float] = None,
+        mask: np.ndarray = None,
+    ):
+        """Build a Meaning without checking that `referents` is a subset of `universe`,
+        for internal callers that guarantee it (e.g. because the referents were taken from `universe`).
+
+        Args:
+            mask: the boolean vector for `referents` over `universe`, if already known
+        """
+        meaning = cls.__new__(cls)
+        meaning._init_trusted(referents, universe, dist, mask)
+        return meaning
 
     def to_dict(self) -> dict:
         return {"referents": [referent.to_dict() for referent in self.referents]}
@@ -169,11 +286,11 @@ class Meaning:
         return bool(self.referents) and bool(self.universe)
 
     def __eq__(self, other):
-        return (self.referents, self.universe) == (other.referents, other.universe)
+        return (self._key, self.universe) == (other._key, other.universe)
 
     def __str__(self):
         return f"Referents:\n\t{','.join(str(referent) for referent in self.referents)}\
             \nDistribution:\n\t{self.dist}\n"
 
     def __hash__(self):
-        return hash(tuple(self.referents))
+        return hash(self._key)